@@ -75,6 +75,9 @@ setup(
         "similaritymeasures",
         "fastdtw",
     ],
+    extras_require={
+        "fast-io": ["pyarrow"]
+    },
     python_requires=">=3.6",
     entry_points={
         "console_scripts": [
@@ -125,6 +125,30 @@ class CommonCmdline(cmd.CoreCmdline):
                         """ + self.stage_usage_doc([4]),
                         default='sigmoid')
 
+        pm.add_argument("--fast-io",
+                        help="""
+
+                        If passed, then collated ``.csv`` files will be read
+                        with :mod:`pyarrow` instead of pandas when calculating
+                        performance measures, which is much faster for large
+                        batches. All columns are read as floats. If the first
+                        file of a batch reads differently than with pandas,
+                        pandas is used after all. Requires :mod:`pyarrow` to be
+                        installed (e.g., via the ``fast-io`` extra).
+
+                        """ + self.stage_usage_doc([4]),
+                        action='store_true')
+
+        pm.add_argument("--pipeline-profile",
+                        help="""
+
+                        If passed, then the wall time and memory usage of
+                        calculating each performance measure will be recorded
+                        in ``stage4_profile.json`` in the batch output root.
+
+                        """ + self.stage_usage_doc([4]),
+                        action='store_true')
+
         # Variance curve similarity options
         vcs = self.parser.add_argument_group(
             'Stage4: Variance Curve Similarity (VCS) Options')
@@ -217,6 +241,8 @@ class CommonCmdline(cmd.CoreCmdline):
             'pm_flexibility_normalize': cli_args.pm_flexibility_normalize,
             'pm_robustness_normalize': cli_args.pm_robustness_normalize,
             'pm_normalize_method': cli_args.pm_normalize_method,
+            'fast_io': cli_args.fast_io,
+            'pipeline_profile': cli_args.pipeline_profile,
         }
 
         if cli_args.pm_all_normalize:
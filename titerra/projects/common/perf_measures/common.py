@@ -20,6 +20,7 @@ Common calculations used by multiple performance measures.
 # Core packages
 import os
 import math
+import logging
 import typing as tp
 
 # 3rd party packages
@@ -392,20 +393,130 @@ class SteadyStateFLBivar(BaseSteadyStateFL):
         return fl_dfs
 
 
+def _collated_csv_path(cmdopts: types.Cmdopts,
+                       exp_dir: str,
+                       csv_leaf: str,
+                       csv_col: str) -> str:
+    return os.path.join(cmdopts["batch_stat_collate_root"],
+                        exp_dir + '-' + csv_leaf + '-' + csv_col + '.csv')
+
+
 def gather_collated_sim_dfs(cmdopts: types.Cmdopts,
                             criteria: bc.IConcreteBatchCriteria,
                             csv_leaf: str,
                             csv_col: str) -> tp.Dict[str, pd.DataFrame]:
+    """Gather the collated .csv files for a performance measure from all
+    experiments in the batch, keyed by experiment directory name.
+
+    Files already read into ``cmdopts['collated_dfs']`` (see
+    :func:`preload_collated_sim_dfs()`) are not read again; those dataframes are
+    shared with other performance measures, so callers must not modify the
+    returned dataframes in place.
+
+    """
     # exp_dirs = criteria.gen_exp_dirnames(cmdopts)
     exp_dirs = utils.exp_range_calc(cmdopts, '', criteria)
-    dfs = {}
-    for d in exp_dirs:
-        csv_ipath = os.path.join(cmdopts["batch_stat_collate_root"],
-                                 d + '-' + csv_leaf + '-' + csv_col + '.csv')
-        dfs[d] = storage.DataFrameReader('storage.csv')(csv_ipath)
+    preloaded = cmdopts.get('collated_dfs') or {}
+    paths = {d: _collated_csv_path(cmdopts, d, csv_leaf, csv_col) for d in exp_dirs}
+    read = read_collated_csvs([path for path in paths.values() if path not in preloaded],
+                              cmdopts.get('fast_io', False))
+
+    return {d: preloaded[path] if path in preloaded else read[path] for d, path in paths.items()}
+
+
+def preload_collated_sim_dfs(cmdopts: types.Cmdopts,
+                             criteria: bc.IConcreteBatchCriteria,
+                             csv_leaf: str,
+                             csv_col: str) -> tp.Dict[str, pd.DataFrame]:
+    """Read the collated .csv files for a performance measure from all
+    experiments in the batch, keyed by path. Many performance measures are
+    calculated from the same collated files; passing the result to them as
+    ``cmdopts['collated_dfs']`` lets :func:`gather_collated_sim_dfs()` share it
+    instead of each measure parsing the files again.
+
+    """
+    return read_collated_csvs(collated_csv_paths(cmdopts, criteria, csv_leaf, csv_col),
+                              cmdopts.get('fast_io', False))
+
+
+def collated_csv_paths(cmdopts: types.Cmdopts,
+                       criteria: bc.IConcreteBatchCriteria,
+                       csv_leaf: str,
+                       csv_col: str) -> tp.List[str]:
+    """Get the paths of the collated .csv files for a performance measure from
+    all experiments in the batch.
+
+    """
+    exp_dirs = utils.exp_range_calc(cmdopts, '', criteria)
+    return [_collated_csv_path(cmdopts, d, csv_leaf, csv_col) for d in exp_dirs]
+
+
+def read_collated_csvs(csv_ipaths: tp.List[str],
+                       fast_io: bool = False) -> tp.Dict[str, pd.DataFrame]:
+    """Read a set of collated .csv files, keyed by path.
+
+    If ``fast_io`` is true, the files are parsed with :mod:`pyarrow` (which must
+    be installed) instead of pandas, which is much faster for wide files. The
+    first file is also read with sierra's reader, and unless every value is
+    exactly the same, all files are read with sierra's reader instead. The one
+    intended difference is that integer columns are read as float64.
+
+    """
+    if not fast_io or not csv_ipaths:
+        return {csv_ipath: read_collated_csv(csv_ipath) for csv_ipath in csv_ipaths}
+
+    first = _read_collated_csv_fast(csv_ipaths[0])
+    expected = storage.DataFrameReader('storage.csv')(csv_ipaths[0])
+    try:
+        pd.testing.assert_frame_equal(first, expected, check_dtype=False, check_exact=True)
+    except AssertionError as e:
+        logging.getLogger(__name__).warning("pyarrow reading of %s does not match sierra's reader, "
+                                            "falling back: %s",
+                                            csv_ipaths[0],
+                                            str(e).strip().splitlines()[0])
+        return {csv_ipath: read_collated_csv(csv_ipath) for csv_ipath in csv_ipaths}
+
+    dfs = {csv_ipaths[0]: first}
+    dfs.update((csv_ipath, read_collated_csv(csv_ipath, True)) for csv_ipath in csv_ipaths[1:])
     return dfs
 
 
+def read_collated_csv(csv_ipath: str, fast_io: bool = False) -> pd.DataFrame:
+    """Read a collated .csv file. See :func:`read_collated_csvs()`; a single
+    file read with ``fast_io`` is not checked against sierra's reader.
+
+    """
+    if not fast_io:
+        return storage.DataFrameReader('storage.csv')(csv_ipath)
+
+    return _read_collated_csv_fast(csv_ipath)
+
+
+def _read_collated_csv_fast(csv_ipath: str) -> pd.DataFrame:
+    """Read a collated .csv file with :mod:`pyarrow`. All columns are read as
+    float64 rather than letting pyarrow infer their types, which it does
+    differently than pandas. Files which cannot be read that way (e.g., with
+    non-numeric columns) are read with sierra's reader instead.
+
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    # Same ';' separated format that sierra's storage.csv reader expects
+    with open(csv_ipath) as f:
+        cols = f.readline().rstrip('\r\n').split(';')
+
+    try:
+        table = pacsv.read_csv(csv_ipath,
+                               parse_options=pacsv.ParseOptions(delimiter=';'),
+                               convert_options=pacsv.ConvertOptions(column_types={col: pa.float64()
+                                                                                  for col in cols}))
+    except pa.ArrowInvalid:
+        return storage.DataFrameReader('storage.csv')(csv_ipath)
+
+    return table.to_pandas()
+
+
 def univar_distribution_prepare(cmdopts: types.Cmdopts,
                                 criteria: bc.IConcreteBatchCriteria,
                                 oleaf: str,
@@ -20,20 +20,270 @@ Classes for generating graphs across experiments in a batch.
 """
 
 # Core packages
-import copy
+import os
+import json
+import pickle
+import glob
+import hashlib
+import logging
+import threading
+import time
+import tracemalloc
+import contextlib
 import typing as tp
+import functools
+import importlib
+import collections
+import concurrent.futures as cf
 
 # 3rd party packages
 import sierra.core.pipeline.stage4 as stage4
 from sierra.core.variables import batch_criteria as bc
-from sierra.core import types
+from sierra.core import types, utils, config
 
 # Project packages
-import titerra.projects.common.perf_measures.self_organization as pmso
-import titerra.projects.common.perf_measures.raw as pmraw
-import titerra.projects.common.perf_measures.robustness as pmb
-import titerra.projects.common.perf_measures.flexibility as pmf
-import titerra.projects.common.perf_measures.scalability as pms
+import titerra.projects.common.perf_measures.common as pmcommon
+
+# The performance measures which can be requested via
+# :meth:`~sierra.core.variables.batch_criteria.IPMQueryableBatchCriteria.pm_query()`,
+# in the order of their bits in the mask returned by :func:`_pm_flags()`.
+kPerfMeasures = ('raw',
+                 'scalability',
+                 'self-org',
+                 'flexibility',
+                 'robustness-pd',
+                 'robustness-saa')
+
+kPMRaw = 1 << 0
+kPMScalability = 1 << 1
+kPMSelfOrg = 1 << 2
+kPMFlexibility = 1 << 3
+kPMRobustnessPD = 1 << 4
+kPMRobustnessSAA = 1 << 5
+
+# Prefix of the sentinel file marking the perf measures for a given set of
+# inputs as generated; the suffix is the digest of the inputs. The sentinel
+# contains the list of ``PM-*`` files present after generating them.
+kPerfSentinelPrefix = '.stage4-pm-done.'
+
+
+def _package_version(package: str) -> tp.Optional[str]:
+    try:
+        return importlib.import_module(package + '.version').__version__
+    except (ImportError, AttributeError):
+        return None
+
+
+def _pm_flags(criteria: bc.IConcreteBatchCriteria) -> int:
+    """Query the batch criteria for all performance measures at once, returning a
+    bitmask of the requested ones (``kPM*``).
+
+    """
+    flags = 0
+    for i, pm in enumerate(kPerfMeasures):
+        if criteria.pm_query(pm):
+            flags |= 1 << i
+
+    return flags
+
+
+def _raw_job(cls: type,
+             gen: 'BasePerfMeasuresGenerator',
+             cmdopts: types.Cmdopts,
+             criteria: bc.IConcreteBatchCriteria) -> tp.Callable[[], None]:
+    labels = {'title': gen.raw_title}
+    if gen.kMode == 'univar':
+        labels['ylabel'] = gen.raw_ylabel
+
+    return functools.partial(cls(cmdopts, gen.perf_csv, gen.perf_col).from_batch,
+                             criteria,
+                             **labels)
+
+
+def _perf_job(cls: type,
+              gen: 'BasePerfMeasuresGenerator',
+              cmdopts: types.Cmdopts,
+              criteria: bc.IConcreteBatchCriteria) -> tp.Callable[[], None]:
+    return functools.partial(cls(), gen.perf_csv, gen.perf_col, cmdopts, criteria)
+
+
+def _perf_interference_job(cls: type,
+                           gen: 'BasePerfMeasuresGenerator',
+                           cmdopts: types.Cmdopts,
+                           criteria: bc.IConcreteBatchCriteria) -> tp.Callable[[], None]:
+    return functools.partial(cls(),
+                             cmdopts,
+                             gen.perf_csv,
+                             gen.perf_col,
+                             gen.interference_csv,
+                             gen.interference_col,
+                             criteria)
+
+
+def _config_job(cls: type,
+                gen: 'BasePerfMeasuresGenerator',
+                cmdopts: types.Cmdopts,
+                criteria: bc.IConcreteBatchCriteria) -> tp.Callable[[], None]:
+    return functools.partial(cls(), cmdopts, gen.main_config, criteria)
+
+
+# (batch criteria type, perf measure) -> (mask of ``kPM*`` flags which enable
+# the measure, perf_measures module, generator class, job builder). Each job builder
+# takes the generator class, the owning :class:`BasePerfMeasuresGenerator`, the
+# cmdopts to generate with, and the batch criteria, and returns a no-argument
+# callable which generates the measure.
+kDispatch = {
+    ('univar', 'raw'): (kPMRaw, 'raw', 'SteadyStateRawUnivar', _raw_job),
+    ('univar', 'scalability'): (kPMScalability,
+                                'scalability',
+                                'ScalabilityUnivarGenerator',
+                                _perf_job),
+    ('univar', 'self-org'): (kPMSelfOrg,
+                             'self_organization',
+                             'SelfOrgUnivarGenerator',
+                             _perf_interference_job),
+    ('univar', 'flexibility'): (kPMFlexibility,
+                                'flexibility',
+                                'FlexibilityUnivarGenerator',
+                                _config_job),
+    ('univar', 'robustness'): (kPMRobustnessPD | kPMRobustnessSAA,
+                               'robustness',
+                               'RobustnessUnivarGenerator',
+                               _config_job),
+
+    ('bivar', 'raw'): (kPMRaw, 'raw', 'SteadyStateRawBivar', _raw_job),
+    ('bivar', 'scalability'): (kPMScalability,
+                               'scalability',
+                               'ScalabilityBivarGenerator',
+                               _perf_job),
+    ('bivar', 'self-org'): (kPMSelfOrg,
+                            'self_organization',
+                            'SelfOrgBivarGenerator',
+                            _perf_interference_job),
+    ('bivar', 'flexibility'): (kPMFlexibility,
+                               'flexibility',
+                               'FlexibilityBivarGenerator',
+                               _config_job),
+    ('bivar', 'robustness'): (kPMRobustnessPD | kPMRobustnessSAA,
+                              'robustness',
+                              'RobustnessBivarGenerator',
+                              _config_job),
+}
+
+
+@contextlib.contextmanager
+def _timed(name: str, records: tp.List[tp.Dict[str, tp.Any]]) -> tp.Iterator[None]:
+    """Record the wall time and traced memory delta/peak of the enclosed block
+    into ``records``.
+
+    """
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+
+    mem_start, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        mem_end, mem_peak = tracemalloc.get_traced_memory()
+        records.append({'name': name,
+                        'wall_s': time.perf_counter() - start,
+                        'mem_delta_bytes': mem_end - mem_start,
+                        'mem_peak_bytes': mem_peak})
+        if not tracing:
+            tracemalloc.stop()
+
+
+def _run_job(name: str,
+             job: tp.Callable[[], None],
+             profile: bool) -> tp.List[tp.Dict[str, tp.Any]]:
+    records = []  # type: tp.List[tp.Dict[str, tp.Any]]
+    if not profile:
+        job()
+        return records
+
+    with _timed(name, records):
+        job()
+
+    return records
+
+
+def _criteria_picklable(criteria: bc.IConcreteBatchCriteria) -> bool:
+    """Check that the batch criteria can be sent to worker processes. Apart from
+    the criteria, jobs only hold perf measure generators, cmdopts, the main
+    config and dataframes, which can always be pickled.
+
+    """
+    try:
+        pickle.dumps(criteria)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        logging.getLogger(__name__).warning("Cannot send batch criteria to perf measure worker processes: %s",
+                                            e)
+        return False
+
+    return True
+
+
+def _run_jobs(jobs: tp.List[tp.Tuple[str, tp.Callable[[], None]]],
+              cmdopts: types.Cmdopts,
+              criteria: bc.IConcreteBatchCriteria) -> None:
+    """Run named perf measure generation jobs. Each job reads collated .csv
+    files and generates its own graphs, so they are independent and are run in
+    parallel in separate processes unless ``--processing-serial`` was passed.
+
+    Each worker receives a pickled copy of its job, which includes the batch
+    criteria and cmdopts, and with them the collated .csv files read up front by
+    :class:`BasePerfMeasuresGenerator`; for batch criteria with many experiments
+    this copying is not free, though it is cheaper than each worker parsing the
+    files itself. If the batch criteria cannot be pickled (e.g., because they
+    hold an open file or a lambda), all jobs are run serially instead of failing
+    in the worker.
+
+    If ``--pipeline-profile`` was passed, the wall time and memory usage of each
+    job is written to ``stage4_profile.json`` in the batch output root.
+
+    """
+    profile = cmdopts['pipeline_profile']
+    records = []  # type: tp.List[tp.Dict[str, tp.Any]]
+
+    if cmdopts['processing_serial'] or len(jobs) <= 1 or not _criteria_picklable(criteria):
+        for name, job in jobs:
+            records.extend(_run_job(name, job, profile))
+    else:
+        with cf.ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+            futures = [pool.submit(_run_job, name, job, profile) for name, job in jobs]
+
+            # Propagate any exceptions from the workers
+            for future in futures:
+                records.extend(future.result())
+
+    if profile:
+        _write_profile(records, cmdopts)
+
+
+def _write_profile(records: tp.List[tp.Dict[str, tp.Any]], cmdopts: types.Cmdopts) -> None:
+    with open(os.path.join(cmdopts['batch_output_root'], 'stage4_profile.json'), 'w') as f:
+        json.dump(records, f, indent=4)
+
+
+@functools.singledispatch
+def _perf_generator_type(criteria: bc.IConcreteBatchCriteria) -> type:
+    """Get the type of perf measure generator to use for the batch criteria,
+    dispatching on the criteria type.
+
+    """
+    raise NotImplementedError("No perf measure generator for {0}".format(type(criteria)))
+
+
+@_perf_generator_type.register(bc.UnivarBatchCriteria)
+def _(criteria: bc.UnivarBatchCriteria) -> type:
+    return UnivarPerfMeasuresGenerator
+
+
+@_perf_generator_type.register(bc.BivarBatchCriteria)
+def _(criteria: bc.BivarBatchCriteria) -> type:
+    return BivarPerfMeasuresGenerator
 
 
 class InterExpGraphGenerator(stage4.inter_exp_graph_generator.InterExpGraphGenerator):
@@ -41,8 +291,22 @@ class InterExpGraphGenerator(stage4.inter_exp_graph_generator.InterExpGraphGener
     :class:`~sierra.core.pipeline.stage4.inter_exp_graph_generator.InterExpGraphGenerator`
     with additional graphs for the TITAN project.
 
+    Can be called concurrently from multiple threads (e.g., for different batch
+    criteria): the perf measure generators only read the main config and
+    cmdopts, and must not modify shared state.
+
+    Attributes:
+        perf_generators: The perf measure generators constructed so far, keyed
+                         by type. They only depend on the main config and
+                         cmdopts, so each is constructed at most once.
+        perf_generators_lock: Guards :attr:`perf_generators`.
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.perf_generators = {}  # type: tp.Dict[type, BasePerfMeasuresGenerator]
+        self.perf_generators_lock = threading.Lock()
+
     def __call__(self, criteria: bc.IConcreteBatchCriteria) -> None:
         """
         In addition to the graphs generated by
@@ -54,122 +318,254 @@ class InterExpGraphGenerator(stage4.inter_exp_graph_generator.InterExpGraphGener
 
         #. :class:`~sierra.core.pipeline.stage4.inter_exp_graph_generator.BivarPerfMeasuresGenerator`
            to generate performance measures (bivariate batch criteria only).
+
+        If the batch criteria do not request any performance measures, neither
+        is constructed. If the performance measures have already been generated
+        from identical inputs (see :meth:`_perf_inputs_digest()`) and none of
+        their outputs have been deleted since, they are not generated again;
+        delete the ``.stage4-pm-done.*`` sentinel in the batch graph root to
+        force regeneration.
         """
         super().__call__(criteria)
-        if criteria.is_univar():
-            UnivarPerfMeasuresGenerator(
-                self.main_config, self.cmdopts)(criteria)
-        else:
-            BivarPerfMeasuresGenerator(self.main_config, self.cmdopts)(criteria)
 
+        pm_flags = _pm_flags(criteria)
+        if not pm_flags:
+            return
+
+        sentinel = os.path.join(self.cmdopts['batch_graph_collate_root'],
+                                kPerfSentinelPrefix + self._perf_inputs_digest(criteria,
+                                                                               pm_flags))
+        if self._perf_outputs_present(sentinel):
+            logging.getLogger(__name__).info("Performance measures up to date in %s",
+                                             self.cmdopts['batch_graph_collate_root'])
+
+            # Don't leave the profile of an earlier run looking like this one's
+            if self.cmdopts['pipeline_profile']:
+                _write_profile([], self.cmdopts)
+            return
+
+        generator_type = _perf_generator_type(criteria)
+        with self.perf_generators_lock:
+            if generator_type not in self.perf_generators:
+                self.perf_generators[generator_type] = generator_type(self.main_config,
+                                                                      self.cmdopts)
+            generator = self.perf_generators[generator_type]
+
+        generator(criteria, pm_flags)
+
+        for stale in glob.glob(os.path.join(self.cmdopts['batch_graph_collate_root'],
+                                            kPerfSentinelPrefix + '*')):
+            os.remove(stale)
+
+        outputs = sorted(path
+                         for root in [self.cmdopts['batch_stat_collate_root'],
+                                      self.cmdopts['batch_graph_collate_root']]
+                         for path in glob.glob(os.path.join(root, 'PM-*')))
+        with open(sentinel, 'w') as f:
+            json.dump(outputs, f)
+
+    @staticmethod
+    def _perf_outputs_present(sentinel: str) -> bool:
+        """Check that the performance measures were generated for the inputs
+        that the sentinel is for, and that none of the outputs recorded in it
+        have been deleted since.
+
+        """
+        try:
+            with open(sentinel) as f:
+                outputs = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        return all(os.path.exists(path) for path in outputs)
+
+    def _perf_inputs_digest(self, criteria: bc.IConcreteBatchCriteria, pm_flags: int) -> str:
+        """Compute a digest of everything the performance measures are generated
+        from: the main config, cmdopts, batch criteria, requested measures,
+        titerra and sierra versions, the perf measure sources, and the contents
+        of the data files which the requested measures read (see
+        :meth:`_perf_input_paths()`).
+
+        Data files are identified by their contents, because earlier stages
+        rewrite them on every run even when nothing changed. The perf measure
+        sources are identified by modification time and size, which only change
+        when they are edited.
+
+        """
+        sources = []  # type: tp.List[tp.Tuple[str, int, int]]
+        for path in sorted(glob.glob(os.path.join(os.path.dirname(pmcommon.__file__), '*.py'))):
+            stat = os.stat(path)
+            sources.append((os.path.basename(path), stat.st_mtime_ns, stat.st_size))
+
+        files = []  # type: tp.List[tp.Tuple[str, tp.Optional[str]]]
+        for path in self._perf_input_paths(criteria, pm_flags):
+            try:
+                with open(path, 'rb') as f:
+                    digest = hashlib.sha256()
+                    for chunk in iter(lambda: f.read(1 << 20), b''):
+                        digest.update(chunk)
+                files.append((path, digest.hexdigest()))
+            except FileNotFoundError:
+                files.append((path, None))
+
+        inputs = json.dumps({'main_config': self.main_config,
+                             'cmdopts': dict(self.cmdopts),
+                             'criteria': [type(criteria).__name__, criteria.cli_arg],
+                             'pm_flags': pm_flags,
+                             'versions': {'titerra': _package_version('titerra'),
+                                          'sierra': _package_version('sierra')},
+                             'sources': sources,
+                             'files': files},
+                            sort_keys=True,
+                            default=str)
+        return hashlib.sha256(inputs.encode()).hexdigest()
+
+    def _perf_input_paths(self,
+                          criteria: bc.IConcreteBatchCriteria,
+                          pm_flags: int) -> tp.List[str]:
+        """Get the paths of the data files which the requested performance
+        measures read: the collated performance (and for self-organization,
+        interference) .csv files, the experiment definitions (self-organization
+        and robustness), the per-experiment performance and environment .csv
+        files (flexibility), and the models.
+
+        """
+        perf = self.main_config['sierra']['perf']
+        exp_dirs = utils.exp_range_calc(self.cmdopts, '', criteria)
+
+        paths = pmcommon.collated_csv_paths(self.cmdopts,
+                                            criteria,
+                                            perf['intra_perf_csv'].split('.')[0],
+                                            perf['intra_perf_col'])
+        if pm_flags & kPMSelfOrg:
+            paths += pmcommon.collated_csv_paths(self.cmdopts,
+                                                 criteria,
+                                                 perf['intra_interference_csv'].split('.')[0],
+                                                 perf['intra_interference_col'])
+
+        if pm_flags & (kPMSelfOrg | kPMRobustnessPD | kPMRobustnessSAA):
+            paths += [os.path.join(self.cmdopts['batch_input_root'], d, config.kPickleLeaf)
+                      for d in exp_dirs]
+
+        if pm_flags & kPMFlexibility:
+            paths += [os.path.join(self.cmdopts['batch_stat_root'], d, csv)
+                      for d in exp_dirs
+                      for csv in [perf['intra_perf_csv'], perf['intra_tv_environment_csv']]]
+
+        paths += sorted(path for path in glob.glob(os.path.join(self.cmdopts['batch_model_root'], '*'))
+                        if os.path.isfile(path))
+        return paths
 
-class UnivarPerfMeasuresGenerator:
+
+class BasePerfMeasuresGenerator:
     """
     Generates performance measures from collated .csv data across a batch of experiments. Which
-    measures are generated is controlled by the batch criteria used for the experiment. Univariate
-    batch criteria only.
+    measures are generated is controlled by the batch criteria used for the experiment, and which
+    generator is used for each measure is looked up in :data:`kDispatch` by :attr:`kMode`.
 
     Attributes:
-        cmdopts: Dictionary of parsed cmdline options.
+        cmdopts: Copy-on-write view of the parsed cmdline options.
         main_config: Dictionary of parsed main YAML config.
+        perf_csv: Name of the intra-experiment performance .csv.
+        perf_col: Column within :attr:`perf_csv` containing performance data.
+        interference_csv: Name of the intra-experiment interference .csv.
+        interference_col: Column within :attr:`interference_csv` containing
+                          interference data.
+        raw_title: Title for raw performance graphs.
+        raw_ylabel: Y-label for raw performance graphs (univariate only).
     """
+    __slots__ = ('cmdopts',
+                 'main_config',
+                 'perf_csv',
+                 'perf_col',
+                 'interference_csv',
+                 'interference_col',
+                 'raw_title',
+                 'raw_ylabel')
+
+    kMode = ''
 
     def __init__(self,
                  main_config: types.YAMLDict,
                  cmdopts: types.Cmdopts) -> None:
-        # Copy because we are modifying it and don't want to mess up the arguments for graphs that
-        # are generated after us
-        self.cmdopts = copy.deepcopy(cmdopts)
+        # Layer over cmdopts rather than copying it: any modifications land in the top map and don't
+        # mess up the arguments for graphs that are generated after us.
+        self.cmdopts = collections.ChainMap({}, cmdopts)
         self.main_config = main_config
 
-    def __call__(self, criteria: bc.IConcreteBatchCriteria) -> None:
-        perf_csv = self.main_config['sierra']['perf']['intra_perf_csv']
-        perf_col = self.main_config['sierra']['perf']['intra_perf_col']
-        interference_csv = self.main_config['sierra']['perf']['intra_interference_csv']
-        interference_col = self.main_config['sierra']['perf']['intra_interference_col']
-        raw_title = self.main_config['sierra']['perf']['raw_perf_title']
-        raw_ylabel = self.main_config['sierra']['perf']['raw_perf_ylabel']
-
-        if criteria.pm_query('raw'):
-            pmraw.SteadyStateRawUnivar(self.cmdopts, perf_csv, perf_col).from_batch(criteria,
-                                                                                    title=raw_title,
-                                                                                    ylabel=raw_ylabel)
-        if criteria.pm_query('scalability'):
-            pms.ScalabilityUnivarGenerator()(perf_csv, perf_col, self.cmdopts, criteria)
-
-        if criteria.pm_query('self-org'):
-            pmso.SelfOrgUnivarGenerator()(self.cmdopts,
-                                          perf_csv,
-                                          perf_col,
-                                          interference_csv,
-                                          interference_col,
-                                          criteria)
-
-        if criteria.pm_query('flexibility'):
-            pmf.FlexibilityUnivarGenerator()(self.cmdopts,
-                                             self.main_config,
-                                             criteria)
-
-        if criteria.pm_query('robustness-pd') or criteria.pm_query('robustness-saa'):
-            pmb.RobustnessUnivarGenerator()(self.cmdopts,
-                                            self.main_config,
-                                            criteria)
-
-
-class BivarPerfMeasuresGenerator:
-    """
-    Generates performance measures from collated .csv data across a batch of experiments. Which
-    measures are generated is controlled by the batch criteria used for the experiment. Bivariate
-    batch criteria only.
+        perf = main_config['sierra']['perf']
+        self.perf_csv = perf['intra_perf_csv']
+        self.perf_col = perf['intra_perf_col']
+        self.interference_csv = perf['intra_interference_csv']
+        self.interference_col = perf['intra_interference_col']
+        self.raw_title = perf['raw_perf_title']
+        self.raw_ylabel = perf['raw_perf_ylabel']
 
-    Attributes:
-        cmdopts: Dictionary of parsed cmdline options.
-        main_config: Dictionary of parsed main YAML config.
+    def __call__(self,
+                 criteria: bc.IConcreteBatchCriteria,
+                 pm_flags: tp.Optional[int] = None) -> None:
+        """
+        Generate the performance measures requested by the batch criteria.
+
+        Args:
+            criteria: The batch criteria used for the experiment.
+            pm_flags: The requested measures as returned by :func:`_pm_flags()`,
+                      if the caller has already computed them.
+        """
+        if pm_flags is None:
+            pm_flags = _pm_flags(criteria)
+
+        # Read the collated .csv files which most of the requested measures
+        # need once, up front, and share them with all measures. They are only
+        # referenced from the cmdopts for this call, so they are freed when it
+        # returns.
+        collated = pmcommon.preload_collated_sim_dfs(self.cmdopts,
+                                                     criteria,
+                                                     self.perf_csv.split('.')[0],
+                                                     self.perf_col)
+        if pm_flags & kPMSelfOrg:
+            collated.update(pmcommon.preload_collated_sim_dfs(self.cmdopts,
+                                                              criteria,
+                                                              self.interference_csv.split('.')[0],
+                                                              self.interference_col))
+        cmdopts = self.cmdopts.new_child({'collated_dfs': collated})
+
+        jobs = []  # type: tp.List[tp.Tuple[str, tp.Callable[[], None]]]
+
+        for (mode, measure), (enabled_by, module, cls, builder) in kDispatch.items():
+            if mode != self.kMode or not pm_flags & enabled_by:
+                continue
+
+            # The perf measure modules are imported only when the measure is
+            # requested, so that generating a subset of them doesn't pay for
+            # loading all.
+            imported = importlib.import_module('titerra.projects.common.perf_measures.' + module)
+            jobs.append((measure, builder(getattr(imported, cls), self, cmdopts, criteria)))
+
+        _run_jobs(jobs, cmdopts, criteria)
+
+
+class UnivarPerfMeasuresGenerator(BasePerfMeasuresGenerator):
+    """
+    Generates performance measures from collated .csv data across a batch of experiments. Univariate
+    batch criteria only. See :class:`BasePerfMeasuresGenerator`.
     """
+    __slots__ = ()
 
-    def __init__(self,
-                 main_config: types.YAMLDict,
-                 cmdopts: types.Cmdopts) -> None:
-        # Copy because we are modifying it and don't want to mess up the arguments for graphs that
-        # are generated after us
-        self.cmdopts = copy.deepcopy(cmdopts)
-        self.main_config = main_config
+    kMode = 'univar'
 
-    def __call__(self, criteria: bc.IConcreteBatchCriteria) -> None:
-        perf_csv = self.main_config['sierra']['perf']['intra_perf_csv']
-        perf_col = self.main_config['sierra']['perf']['intra_perf_col']
-        interference_csv = self.main_config['sierra']['perf']['intra_interference_csv']
-        interference_col = self.main_config['sierra']['perf']['intra_interference_col']
-        raw_title = self.main_config['sierra']['perf']['raw_perf_title']
-
-        if criteria.pm_query('raw'):
-            pmraw.SteadyStateRawBivar(self.cmdopts,
-                                      perf_csv=perf_csv,
-                                      perf_col=perf_col).from_batch(criteria,
-                                                                    title=raw_title)
-
-        if criteria.pm_query('scalability'):
-            pms.ScalabilityBivarGenerator()(perf_csv, perf_col, self.cmdopts, criteria)
-
-        if criteria.pm_query('self-org'):
-            pmso.SelfOrgBivarGenerator()(self.cmdopts,
-                                         perf_csv,
-                                         perf_col,
-                                         interference_csv,
-                                         interference_col,
-                                         criteria)
-
-        if criteria.pm_query('flexibility'):
-            pmf.FlexibilityBivarGenerator()(self.cmdopts,
-                                            self.main_config,
-                                            criteria)
-
-        if criteria.pm_query('robustness-pd') or criteria.pm_query('robustness-saa'):
-            pmb.RobustnessBivarGenerator()(self.cmdopts,
-                                           self.main_config,
-                                           criteria)
+
+class BivarPerfMeasuresGenerator(BasePerfMeasuresGenerator):
+    """
+    Generates performance measures from collated .csv data across a batch of experiments. Bivariate
+    batch criteria only. See :class:`BasePerfMeasuresGenerator`.
+    """
+    __slots__ = ()
+
+    kMode = 'bivar'
 
 
 __api__ = ['InterExpGraphGenerator',
+           'BasePerfMeasuresGenerator',
            'BivarPerfMeasuresGenerator',
            'UnivarPerfMeasuresGenerator']
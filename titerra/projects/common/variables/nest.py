@@ -17,6 +17,7 @@
 # Core packages
 import typing as tp
 import math
+import functools
 
 # 3rd party packages
 import implements
@@ -39,6 +40,18 @@ class Nest():
       extents: List of arena extents to generation nest poses for.
     """
 
+    # (dims X, dims Y, center X, center Y) for the nest for each block
+    # distribution type, as fractions of the arena upper right corner.
+    kNestFracs = {
+        'SS': (0.1, 0.8, 0.1, 0.5),
+        'DS': (0.1, 0.8, 0.5, 0.5),
+        'PL': (0.2, 0.2, 0.5, 0.5),
+        'RN': (0.2, 0.2, 0.5, 0.5),
+        'QS': (0.2, 0.2, 0.5, 0.5),
+    }
+
+    __slots__ = ('dist_type', 'src', 'arena', 'tag_adds')
+
     def __init__(self,
                  src: str,
                  arena: tp.Optional[ArenaExtent] = None,
@@ -67,50 +80,51 @@ class Nest():
             return [self.tag_adds]
 
         if self.src == 'arena':
-            root = XMLTagAdd(".//arena_map", "nests", {}, False)
-            self.tag_adds = self.gen_adds_from_arena()
-            self.tag_adds.prepend(root)
+            self.tag_adds = XMLTagAddList(XMLTagAdd(".//arena_map",
+                                                    "nests",
+                                                    {},
+                                                    False))
+            self.tag_adds.extend(self.gen_adds_from_arena())
         else:
             assert False, "Bad source {0}".format(self.src)
 
         return [self.tag_adds]
 
     def gen_adds_from_arena(self) -> XMLTagAddList:
-        if self.dist_type == 'SS':
-            attr = {
-                "dims": "{0:.9f}, {1:.9f}".format(self.arena.ur.x * 0.1,
-                                                  self.arena.ur.y * 0.8),
-                "center": "{0:.9f}, {1:.9f}".format(self.arena.ur.x * 0.1,
-                                                    self.arena.ur.y / 2.0)
-            }
-            return XMLTagAddList(
-                XMLTagAdd(".//arena_map/nests", "nest", attr, False),
-                XMLTagAdd(".//params", "nest", attr, False)
-            )
-
-        if self.dist_type == 'DS':
-            attr = {
-                "dims": "{0:.9f}, {1:.9f}".format(self.arena.ur.x * 0.1,
-                                                  self.arena.ur.y * 0.8),
-                "center": "{0:.9f}, {1:.9f}".format(self.arena.ur.x * 0.5,
-                                                    self.arena.ur.y * 0.5),
-            }
-            return XMLTagAddList(
-                XMLTagAdd(".//arena_map/nests", "nest", attr, False),
-                XMLTagAdd(".//params", "nest", attr, False)
-            )
-        if (self.dist_type == 'PL' or self.dist_type == 'RN' or self.dist_type == 'QS'):
-            attr = {
-                "dims": "{0:.9f}, {1:.9f}".format(self.arena.ur.x * 0.2,
-                                                  self.arena.ur.y * 0.2),
-                "center": "{0:.9f}, {1:.9f}".format(self.arena.ur.x * 0.5,
-                                                    self.arena.ur.y * 0.5),
-            }
-            return XMLTagAddList(
-                XMLTagAdd(".//arena_map/nests", "nest", attr, False),
-                XMLTagAdd(".//params", "nest", attr, False)
-            )
-
         # Eventually, I might want to have definitions for the other block distribution
         # types
-        raise NotImplementedError
+        if self.dist_type not in self.kNestFracs:
+            raise NotImplementedError
+
+        dims, center = self._calc_nest_pose(self.dist_type,
+                                            self.arena.ur.x,
+                                            self.arena.ur.y)
+        attr = {
+            "dims": dims,
+            "center": center
+        }
+        return self._gen_nest_adds(attr)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _calc_nest_pose(dist_type: str, ux: float, uy: float) -> tp.Tuple[str, str]:
+        """
+        Calculate the nest dims and center strings for the specified block
+        distribution type and arena upper right corner. Memoized, because batch
+        experiments create many nests for the same few arena sizes.
+        """
+        dx, dy, cx, cy = Nest.kNestFracs[dist_type]
+        return (f"{ux * dx:.9f}, {uy * dy:.9f}",
+                f"{ux * cx:.9f}, {uy * cy:.9f}")
+
+    @staticmethod
+    def _gen_nest_adds(attr: tp.Dict[str, str]) -> XMLTagAddList:
+        """
+        Generate the tags for the nest in the arena map and in the robot
+        params. Both tags have identical attributes, so they share the same
+        dictionary.
+        """
+        return XMLTagAddList(
+            XMLTagAdd(".//arena_map/nests", "nest", attr, False),
+            XMLTagAdd(".//params", "nest", attr, False)
+        )
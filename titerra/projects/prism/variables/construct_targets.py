@@ -23,9 +23,12 @@ for usage documentation.
 # Core packages
 import logging  # type: ignore
 import typing as tp
+import functools
+from xml.sax.saxutils import escape
 
 # 3rd party packages
 import networkx as nx
+import numpy as np
 import implements
 from sierra.core.vector import Vector3D
 from sierra.core.xml import XMLTagAddList, XMLTagAdd
@@ -35,6 +38,55 @@ from sierra.core import types
 from sierra.core.utils import ArenaExtent
 from titerra.projects.prism import gmt_spec
 from titerra.projects.prism.variables.orientation import Orientation
+from titerra.projects.prism.variables import graphml_writer
+
+# The orientation of all virtual blocks; they have no physical extent beyond
+# their anchor cell, so it does not matter.
+kVirtualZRot = Orientation("0")
+
+# The (X,Y,Z) unit vector along which blocks extend from their anchor for each
+# orientation, keyed by the orientation string.
+kBlockExtentUnits = {
+    '0': (1, 0, 0),
+    'PI': (-1, 0, 0),
+    'PI/2': (0, 1, 0),
+    '3PI/2': (0, -1, 0)
+}
+
+# The (X,Y) ratios between the length of ramp blocks and cube blocks for each
+# orientation, keyed by the orientation string.
+kRampRatios = {
+    '0': (2, 1),
+    'PI': (2, 1),
+    'PI/2': (1, 2),
+    '3PI/2': (1, 2)
+}
+
+# The GraphML attribute keys of construction target graphs, as (domain, name,
+# type) tuples.
+kGraphMLKeys = (('node', gmt_spec.kBlockTypeKey, 'long'),
+                ('node', gmt_spec.kVertexAnchorKey, 'string'),
+                ('node', gmt_spec.kVertexZRotKey, 'string'),
+                ('node', gmt_spec.kVertexColorKey, 'string'),
+                ('edge', 'weight', 'long'))
+
+# (X,Y,Z) offsets of the manhattan neighbors of a cell, in the order edges to
+# them are added to the graph.
+kNeighborOffsets = ((0, 1, 0),
+                    (0, -1, 0),
+                    (1, 0, 0),
+                    (-1, 0, 0),
+                    (0, 0, -1),
+                    (0, 0, 1))
+
+# (X,Y,Z) offsets of the manhattan neighbors of a cell, in the order they are
+# checked when adding a virtual shell around a structure.
+kShellOffsets = ((1, 0, 0),
+                 (-1, 0, 0),
+                 (0, 1, 0),
+                 (0, -1, 0),
+                 (0, 0, 1),
+                 (0, 0, -1))
 
 
 class IConcreteGMT(implements.Interface):
@@ -60,8 +112,25 @@ class BaseConstructTarget():
     Attributes:
         structure: Dictionary of (key,value) pairs defining the structure, as
                    returned by :class:`ConstructTargetSetParser`.
+        xsize: The X size of the bounding box.
+        ysize: The Y size of the bounding box.
+        zsize: The Z size of the bounding box.
+        bb_str: The bounding box size as an XML attribute string.
+        anchor_str: The bounding box origin as an XML attribute string.
     """
 
+    __slots__ = ('spec',
+                 'paradigm',
+                 'target_id',
+                 'graphml_path',
+                 'extent',
+                 'logger',
+                 'xsize',
+                 'ysize',
+                 'zsize',
+                 'bb_str',
+                 'anchor_str')
+
     def __init__(self,
                  spec: types.CLIArgSpec,
                  target_id: int,
@@ -80,6 +149,13 @@ class BaseConstructTarget():
                                                 self.spec['bb'][2]))
         self.logger = logging.getLogger(__name__)
         self.logger.info("BB=%s", self.extent)
+        self.xsize = self.extent.xsize()
+        self.ysize = self.extent.ysize()
+        self.zsize = self.extent.zsize()
+
+        origin = self.extent.origin()
+        self.bb_str = f"{self.xsize},{self.ysize},{self.zsize}"
+        self.anchor_str = f"{origin.x},{origin.y},{origin.z}"
 
     def gen_xml(self, uuid: str) -> XMLTagAddList:
         """
@@ -88,12 +164,8 @@ class BaseConstructTarget():
         """
         # Direct XML for simulation input file
         attrs = {
-            'bounding_box': "{0},{1},{2}".format(self.extent.xsize(),
-                                                 self.extent.ysize(),
-                                                 self.extent.zsize()),
-            'anchor': "{0},{1},{2}".format(self.extent.origin().x,
-                                           self.extent.origin().y,
-                                           self.extent.origin().z),
+            'bounding_box': self.bb_str,
+            'anchor': self.anchor_str,
             'orientation': self.spec['orientation'],
             'graphml': self.graphml_path
         }
@@ -104,10 +176,35 @@ class BaseConstructTarget():
 
     def write_graphml(self, graph: nx.Graph, path: str) -> None:
         """
-        Writes generated GraphML to the filesystem.
+        Writes generated GraphML to the filesystem. Graphs whose attributes
+        are all integers or strings (i.e., all graphs generated by construction
+        targets) are streamed to the filesystem directly; anything else falls
+        back to networkx.
         """
         self.logger.info("Write graph to %s", path)
-        nx.write_graphml(graph, path)
+        try:
+            graphml_writer.write_graphml_fast(graph.nodes(data=True),
+                                              graph.edges(data=True),
+                                              path)
+        except ValueError:
+            nx.write_graphml(graph, path)
+
+    def open_graphml_stream(self, path: str) -> graphml_writer.GraphMLWriter:
+        """
+        Open a GraphML file for streaming the vertices and edges of the target
+        to directly, declaring the standard construction target attributes.
+        Use as a context manager.
+        """
+        self.logger.info("Write graph to %s", path)
+        return graphml_writer.GraphMLWriter(path, kGraphMLKeys)
+
+    def gen_graphml(self, path: str) -> None:
+        """
+        Generate the graph for the target and write it to the filesystem as
+        GraphML. Targets which can write their GraphML directly without building
+        a graph first override this.
+        """
+        self.write_graphml(self.gen_graph(), path)
 
     def coord_within_bb(self, c: Vector3D) -> bool:
         index_bounds = self.extent.dims
@@ -120,24 +217,35 @@ class BaseConstructTarget():
         return True
 
     def graph_virtual_shell_add(self, graph: nx.Graph) -> nx.Graph:
-        for vd in graph.copy():
-            xplus1 = Vector3D(1, 0, 0)
-            xminus1 = Vector3D(-1, 0, 0)
-            yplus1 = Vector3D(0, 1, 0)
-            yminus1 = Vector3D(0, -1, 0)
-            zplus1 = Vector3D(0, 0, 1)
-            zminus1 = Vector3D(0, 0, -1)
-            neighbors = [xplus1, xminus1, yplus1, yminus1, zplus1, zminus1]
-
-            c = self.calc_vertex_coord(vd, self.extent)
-            for n in neighbors:
-                n_vd = self.calc_vertex_descriptor(c + n, self.extent)
-                if n_vd not in graph and self.coord_within_bb(c + n):
-                    self.graph_block_add(graph,
-                                         'vbeam1',
-                                         c + n,
-                                         Orientation("0"))
-
+        """
+        Adds virtual vertices to the graph for all cells within the bounding
+        box which are manhattan neighbors of the structure but not part of it.
+        """
+        xsize = self.xsize
+        ysize = self.ysize
+        zsize = self.zsize
+        xysize = xsize * ysize
+
+        # Find the shell first, in the order cells are discovered, and then add
+        # all of it at once, rather than probing the graph as it grows.
+        shell = {}  # type: tp.Dict[int, tp.Tuple[int, int, int]]
+        for vd in graph:
+            z, rem = divmod(vd, xysize)
+            y, x = divmod(rem, xsize)
+            for dx, dy, dz in kShellOffsets:
+                if not (0 <= x + dx < xsize and
+                        0 <= y + dy < ysize and
+                        0 <= z + dz < zsize):
+                    continue
+
+                n_vd = vd + dx + dy * xsize + dz * xysize
+                if n_vd not in graph and n_vd not in shell:
+                    shell[n_vd] = (x + dx, y + dy, z + dz)
+
+        self._graph_cube_blocks_add(graph,
+                                    'vbeam1',
+                                    shell.values(),
+                                    kVirtualZRot)
         return graph
 
     def graph_complement_shell_add(self, graph: nx.Graph) -> nx.Graph:
@@ -149,17 +257,22 @@ class BaseConstructTarget():
                        check when adding virtual vertices because it is
                        non-trivial.
         """
-        for i in range(0, self.extent.xsize()):
-            for j in range(0, self.extent.ysize()):
-                for k in range(0, self.extent.zsize()):
-                    c = Vector3D(i, j, k)
-                    vd = self.calc_vertex_descriptor(c, self.extent)
-                    if vd not in graph:
-                        self.graph_block_add(graph,
-                                             'vbeam1',
-                                             c,
-                                             Orientation("0"))
-
+        xsize = self.xsize
+        ysize = self.ysize
+        zsize = self.zsize
+
+        # Find all cells in the bounding box not in the graph at once, in the
+        # same X,Y,Z-major order they would be visited by looping over the
+        # bounding box, and then add all of them.
+        x, y, z = np.mgrid[0:xsize, 0:ysize, 0:zsize]
+        coords = np.stack((x.ravel(), y.ravel(), z.ravel()), axis=1)
+        vds = (coords[:, 2] * ysize + coords[:, 1]) * xsize + coords[:, 0]
+        existing = np.fromiter(graph, dtype=vds.dtype, count=len(graph))
+
+        self._graph_cube_blocks_add(graph,
+                                    'vbeam1',
+                                    coords[~np.isin(vds, existing)].tolist(),
+                                    kVirtualZRot)
         return graph
 
     def graph_block_remove(self,
@@ -193,11 +306,13 @@ class BaseConstructTarget():
                               c: Vector3D,
                               z_rot: Orientation) -> None:
         # Add the anchor
+        trace = self.logger.isEnabledFor(logging.TRACE)
         vd1 = self.calc_vertex_descriptor(c, self.extent)
-        self.logger.trace("Add %s anchor1: %s -> %s", block_type, vd1, c)
+        if trace:
+            self.logger.trace("Add %s anchor1: %s -> %s", block_type, vd1, c)
         attrs = {
             gmt_spec.kBlockTypeKey: gmt_spec.kBlockTypes[block_type],
-            gmt_spec.kVertexAnchorKey: '{0},{1},{2}'.format(c.x, c.y, c.z),
+            gmt_spec.kVertexAnchorKey: f'{c.x},{c.y},{c.z}',
             gmt_spec.kVertexZRotKey: str(z_rot),
             gmt_spec.kVertexColorKey: gmt_spec.kBlockColors[block_type]
         }
@@ -215,15 +330,14 @@ class BaseConstructTarget():
         # Add the other end
         end = extent[-1]
         vd2 = self.calc_vertex_descriptor(end, self.extent)
-        self.logger.trace("Add %s anchor2: %s -> %s", block_type, vd2, end)
+        if trace:
+            self.logger.trace("Add %s anchor2: %s -> %s", block_type, vd2, end)
 
         # We only need block anchor and color attributes. All other
         # information is encoding into the graph itself in the form of
         # additional vertices.
         attrs = {
-            gmt_spec.kVertexAnchorKey: '{0},{1},{2}'.format(end.x,
-                                                            end.y,
-                                                            end.z),
+            gmt_spec.kVertexAnchorKey: f'{end.x},{end.y},{end.z}',
             gmt_spec.kVertexColorKey: gmt_spec.kBlockColors[block_type]
         }
         assert not graph.has_node(vd2), f"vd={vd2}=vertex@{c} already exists"
@@ -242,10 +356,11 @@ class BaseConstructTarget():
         Idempotently add a node of the specified type and its edges.
         """
         vd = self.calc_vertex_descriptor(c, self.extent)
-        self.logger.trace("Add %s anchor: %s -> %s", block_type, vd, c)
+        if self.logger.isEnabledFor(logging.TRACE):
+            self.logger.trace("Add %s anchor: %s -> %s", block_type, vd, c)
         attrs = {
             gmt_spec.kBlockTypeKey: gmt_spec.kBlockTypes[block_type],
-            gmt_spec.kVertexAnchorKey: '{0},{1},{2}'.format(c.x, c.y, c.z),
+            gmt_spec.kVertexAnchorKey: f'{c.x},{c.y},{c.z}',
             gmt_spec.kVertexZRotKey: str(z_rot),
             gmt_spec.kVertexColorKey: gmt_spec.kBlockColors[block_type]
         }
@@ -259,31 +374,109 @@ class BaseConstructTarget():
                                      vd: int,
                                      block_type: str,
                                      c: Vector3D) -> None:
-        xplus1 = Vector3D(1, 0, 0)
-        xminus1 = Vector3D(-1, 0, 0)
-        yplus1 = Vector3D(0, 1, 0)
-        yminus1 = Vector3D(0, -1, 0)
-        zminus1 = Vector3D(0, 0, -1)
-        zplus1 = Vector3D(0, 0, 1)
-
-        neighbors = [yplus1, yminus1, xplus1, xminus1, zminus1, zplus1]
-
-        # Connect vertex to its manhattan neighbors.
-        for n in neighbors:
-            if not self.coord_within_bb(c + n):
+        xsize = self.xsize
+        ysize = self.ysize
+        zsize = self.zsize
+        xysize = xsize * ysize
+        trace = self.logger.isEnabledFor(logging.TRACE)
+        edges = []
+
+        # Connect vertex to its manhattan neighbors. Neighbor descriptors are
+        # offsets from vd, so they can be computed with integer arithmetic
+        # instead of from a new coordinate for each neighbor.
+        for dx, dy, dz in kNeighborOffsets:
+            ncx = c.x + dx
+            ncy = c.y + dy
+            ncz = c.z + dz
+            if not (0 <= ncx < xsize and 0 <= ncy < ysize and 0 <= ncz < zsize):
                 continue
 
-            n_vd = self.calc_vertex_descriptor(c + n, self.extent)
+            n_vd = vd + dx + dy * xsize + dz * xysize
             if n_vd not in graph:
                 continue
 
-            graph.add_edge(vd, n_vd, weight=1)
-            self.logger.trace("Add %s edge: origin -> neighbor: % s -> %s (%s -> %s)",
-                              block_type,
-                              c,
-                              c + n,
-                              vd,
-                              n_vd)
+            edges.append((vd, n_vd, 1))
+            if trace:
+                self.logger.trace("Add %s edge: origin -> neighbor: % s -> %s (%s -> %s)",
+                                  block_type,
+                                  c,
+                                  Vector3D(ncx, ncy, ncz),
+                                  vd,
+                                  n_vd)
+
+        graph.add_weighted_edges_from(edges)
+
+    def _graph_cube_blocks_add(self,
+                               graph: nx.Graph,
+                               block_type: str,
+                               anchors: tp.Iterable[tp.Sequence[int]],
+                               z_rot: Orientation) -> None:
+        """
+        Add cube blocks (``beam1`` or ``vbeam1``) of the specified type at each
+        of the (X,Y,Z) anchors, in order, along with their edges. Equivalent to
+        calling :meth:`graph_block_add` for each anchor, but all nodes and edges
+        are added to the graph at once. Cube blocks have no other end, so this
+        is the same for all paradigms.
+
+        Edges are generated in the same order as adding blocks one by one, so
+        the generated GraphML is semantically identical.
+        """
+        if self.paradigm not in ['semantic', 'edge']:
+            raise NotImplementedError
+
+        xsize = self.xsize
+        ysize = self.ysize
+        zsize = self.zsize
+        xysize = xsize * ysize
+
+        assert gmt_spec.kBlockExtents[block_type] == 1,\
+            f"{block_type} blocks are not cubes"
+        template = self._cube_block_attrs_template(block_type, z_rot)
+        anchor_key = gmt_spec.kVertexAnchorKey
+        order = {}  # type: tp.Dict[int, int]
+        nodes = []
+        edges = []
+
+        for i, (x, y, z) in enumerate(anchors):
+            vd = z * xysize + y * xsize + x
+            assert vd not in order and not graph.has_node(vd),\
+                f"vd={vd}=vertex@{x},{y},{z} already exists"
+            order[vd] = i
+            attrs = template.copy()
+            attrs[anchor_key] = f'{x},{y},{z}'
+            nodes.append((vd, attrs))
+
+            # Only connect to neighbors which were added before this vertex;
+            # later neighbors connect back to it when they are added.
+            for dx, dy, dz in kNeighborOffsets:
+                if not (0 <= x + dx < xsize and
+                        0 <= y + dy < ysize and
+                        0 <= z + dz < zsize):
+                    continue
+
+                n_vd = vd + dx + dy * xsize + dz * xysize
+                if order.get(n_vd, i) < i or graph.has_node(n_vd):
+                    edges.append((vd, n_vd, 1))
+
+        graph.add_nodes_from(nodes)
+        graph.add_weighted_edges_from(edges)
+
+    @staticmethod
+    def _cube_block_attrs_template(block_type: str,
+                                   z_rot: Orientation) -> tp.Dict[str, tp.Any]:
+        """
+        Get the vertex attributes shared by all cube blocks of the specified
+        type and orientation, with the anchor left as ``None``. Only the anchor
+        differs between vertices, so copying this and filling in the anchor is
+        cheaper than building each dict from scratch, and keeps the attributes
+        in the usual order.
+        """
+        return {
+            gmt_spec.kBlockTypeKey: gmt_spec.kBlockTypes[block_type],
+            gmt_spec.kVertexAnchorKey: None,
+            gmt_spec.kVertexZRotKey: str(z_rot),
+            gmt_spec.kVertexColorKey: gmt_spec.kBlockColors[block_type]
+        }
 
     def _graph_ramp2_add(self,
                          graph: nx.Graph,
@@ -296,57 +489,65 @@ class BaseConstructTarget():
                        errors will result.
 
         """
+        trace = self.logger.isEnabledFor(logging.TRACE)
+        xsize = self.xsize
+        ysize = self.ysize
+        zsize = self.zsize
+
         # Add anchor node
         vd = self.calc_vertex_descriptor(c, self.extent)
-        self.logger.trace("Add ramp anchor: %s -> %s", vd, c)
+        if trace:
+            self.logger.trace("Add ramp anchor: %s -> %s", vd, c)
 
         attrs = {
             gmt_spec.kBlockTypeKey: gmt_spec.kBlockTypes['ramp2'],
-            gmt_spec.kVertexAnchorKey: '{0},{1},{2}'.format(c.x, c.y, c.z),
+            gmt_spec.kVertexAnchorKey: f'{c.x},{c.y},{c.z}',
             gmt_spec.kVertexZRotKey: str(z_rot),
             gmt_spec.kVertexColorKey: gmt_spec.kBlockColors['ramp2']
         }
         graph.add_node(vd, **attrs)
 
+        edges = []
         zratio = 1
-        if z_rot.is_EW():
-            xratio = 2
-            yratio = 1
-        elif z_rot.is_NS():
-            xratio = 1
-            yratio = 2
-
-        if c.x < self.extent.xsize() - xratio:
-            dest = Vector3D(c.x + xratio, c.y, c.z)
-            graph.add_edge(vd,
-                           self.calc_vertex_descriptor(dest, self.extent),
-                           weight=str(xratio))
-            self.logger.trace(
-                "Add ramp edge: %s -> %s,weight=%s", c, dest, xratio)
-
-        if c.y < self.extent.ysize() - yratio:
-            dest = Vector3D(c.x, c.y + yratio, c.z)
-            graph.add_edge(vd,
-                           self.calc_vertex_descriptor(dest, self.extent),
-                           weight=str(yratio))
-            self.logger.trace(
-                "Add ramp edge: %s -> %s,weight=%s", c, dest, yratio)
-
-        if c.z < self.extent.zsize() - zratio:
-            dest = Vector3D(c.x, c.y, c.z + zratio)
-            graph.add_edge(vd,
-                           self.calc_vertex_descriptor(dest, self.extent),
-                           weight=str(zratio))
-            self.logger.trace(
-                "Add ramp edge: %s -> %s,weight=%s", c, dest, zratio)
+        xratio, yratio = kRampRatios[z_rot.str_val]
+
+        # Destination descriptors are offsets from vd, so the destination
+        # coordinates are only needed for logging.
+        if c.x < xsize - xratio:
+            edges.append((vd, vd + xratio, str(xratio)))
+            if trace:
+                self.logger.trace("Add ramp edge: %s -> %s,weight=%s",
+                                  c,
+                                  Vector3D(c.x + xratio, c.y, c.z),
+                                  xratio)
+
+        if c.y < ysize - yratio:
+            edges.append((vd, vd + yratio * xsize, str(yratio)))
+            if trace:
+                self.logger.trace("Add ramp edge: %s -> %s,weight=%s",
+                                  c,
+                                  Vector3D(c.x, c.y + yratio, c.z),
+                                  yratio)
+
+        if c.z < zsize - zratio:
+            edges.append((vd, vd + zratio * xsize * ysize, str(zratio)))
+            if trace:
+                self.logger.trace("Add ramp edge: %s -> %s,weight=%s",
+                                  c,
+                                  Vector3D(c.x, c.y, c.z + zratio),
+                                  zratio)
+
+        graph.add_weighted_edges_from(edges)
 
     @staticmethod
     def calc_vertex_coord(vd: int, extent: ArenaExtent) -> Vector3D:
-        z = int(vd / (extent.xsize() * extent.ysize()))
-        vd = vd - (z * extent.xsize() * extent.ysize())
-
-        y = int(vd / extent.xsize())
-        x = vd % extent.xsize()
+        """
+        Map a vertex descriptor back to the (X,Y,Z) coordinate it corresponds
+        to; the inverse of :meth:`calc_vertex_descriptor`.
+        """
+        xsize = extent.xsize()
+        z, vd = divmod(vd, xsize * extent.ysize())
+        y, x = divmod(vd, xsize)
         return Vector3D(x, y, z)
 
     @staticmethod
@@ -356,9 +557,8 @@ class BaseConstructTarget():
         position in a 1D representation of a 3D array.
 
         """
-        return n.z * extent.xsize() * extent.ysize() + \
-            n.y * extent.xsize() + \
-            n.x
+        xsize = extent.xsize()
+        return (n.z * extent.ysize() + n.y) * xsize + n.x
 
     @staticmethod
     def calc_block_extent(graph: nx.Graph,
@@ -376,18 +576,20 @@ class BaseConstructTarget():
         if size == 1:
             return coords
 
-        if z_rot.is_N():
-            for y in range(anchor.y, anchor.y + size):
-                coords.append(anchor + Vector3D(0, 1, 0) * y)
-        elif z_rot.is_S():
-            for y in range(anchor.y, anchor.y - size, -1):
-                coords.append(anchor - Vector3D(0, 1, 0) * y)
-        elif z_rot.is_E():
-            for x in range(anchor.x, anchor.x + size):
-                coords.append(anchor + Vector3D(1, 0, 0) * x)
-        elif z_rot.is_W():
-            for x in range(anchor.x, anchor.x - size, -1):
-                coords.append(anchor - Vector3D(1, 0, 0) * x)
+        unit = kBlockExtentUnits.get(z_rot.str_val)
+        if unit is None:
+            return coords
+
+        ux, uy, _ = unit
+        if ux != 0:
+            start, direction = anchor.x, ux
+        else:
+            start, direction = anchor.y, uy
+
+        for i in range(start, start + direction * size, direction):
+            coords.append(Vector3D(anchor.x + ux * i,
+                                   anchor.y + uy * i,
+                                   anchor.z))
 
         return coords
 
@@ -414,6 +616,8 @@ class Beam1Prism(BaseConstructTarget):
     Construction target class for 3D rectangular prismatic structures composed
     only of cube blocks.
     """
+    __slots__ = ()
+
     @staticmethod
     def uuid(target_id: int) -> str:
         return 'beam1prism' + str(target_id)
@@ -426,28 +630,154 @@ class Beam1Prism(BaseConstructTarget):
         super().__init__(spec, target_id, paradigm, graphml_path)
 
     def gen_graph(self) -> nx.Graph:
+        if self.paradigm not in ['semantic', 'edge']:
+            raise NotImplementedError
+
         graph = nx.Graph()
+        vds, anchors, edges = self._calc_geometry(self.xsize,
+                                                  self.ysize,
+                                                  self.zsize,
+                                                  self.spec['orientation'].is_EW())
+
+        template = self._cube_block_attrs_template('beam1',
+                                                   self.spec['orientation'])
+        anchor_key = gmt_spec.kVertexAnchorKey
+        nodes = []
+        for vd, (x, y, z) in zip(vds.tolist(), anchors.tolist()):
+            attrs = template.copy()
+            attrs[anchor_key] = f'{x},{y},{z}'
+            nodes.append((vd, attrs))
+
+        graph.add_nodes_from(nodes)
+        graph.add_weighted_edges_from((u, v, 1) for u, v in edges.tolist())
 
-        # For rectprisms, there is no difference in the generated GRAPHML for +X
-        # vs -X, or +Y vs -Y.
-        if self.spec['orientation'].is_EW():
-            for x in range(0, self.extent.xsize()):
-                for y in range(0, self.extent.ysize()):
-                    for z in range(0, self.extent.zsize()):
-                        self.graph_block_add(graph,
-                                             'beam1',
-                                             Vector3D(x, y, z),
-                                             self.spec['orientation'])
-        elif self.spec['orientation'].is_NS():
-            for y in range(0, self.extent.ysize()):
-                for x in range(0, self.extent.xsize()):
-                    for z in range(0, self.extent.zsize()):
-                        self.graph_block_add(graph,
-                                             'beam1',
-                                             Vector3D(x, y, z),
-                                             self.spec['orientation'])
         return graph
 
+    def write_graphml_direct(self, path: str) -> None:
+        """
+        Write the GraphML for the prism to the filesystem directly from its
+        vertices and edges, without building a networkx graph first. The result
+        is equivalent to ``write_graphml(gen_graph(), path)``.
+        """
+        if self.paradigm not in ['semantic', 'edge']:
+            raise NotImplementedError
+
+        vds, anchors, edges = self._calc_geometry(self.xsize,
+                                                  self.ysize,
+                                                  self.zsize,
+                                                  self.spec['orientation'].is_EW())
+
+        with self.open_graphml_stream(path) as stream:
+            # All vertices have the same block type, orientation, and color, so
+            # only the vertex descriptor and anchor vary. The <data> elements
+            # come from the stream so the key IDs match its header.
+            def data(domain: str, name: str, val: str) -> str:
+                return stream.data[(domain, name)] % val
+
+            def const(val: tp.Any) -> str:
+                return escape(str(val)).replace('%', '%%')
+
+            node = ('    <node id="%d">\n' +
+                    data('node',
+                         gmt_spec.kBlockTypeKey,
+                         const(gmt_spec.kBlockTypes['beam1'])) +
+                    data('node', gmt_spec.kVertexAnchorKey, '%d,%d,%d') +
+                    data('node',
+                         gmt_spec.kVertexZRotKey,
+                         const(self.spec['orientation'])) +
+                    data('node',
+                         gmt_spec.kVertexColorKey,
+                         const(gmt_spec.kBlockColors['beam1'])) +
+                    '    </node>\n')
+            edge = ('    <edge source="%d" target="%d">\n' +
+                    data('edge', 'weight', '1') +
+                    '    </edge>\n')
+
+            # Every vertex and edge uses the same template, so write them
+            # straight to the stream rather than going through per-element
+            # dicts.
+            stream.outfile.writelines(node % (vd, *anchor)
+                                      for vd, anchor in zip(vds.tolist(),
+                                                            anchors.tolist()))
+            stream.outfile.writelines(edge % (u, v) for u, v in edges.tolist())
+
+    def gen_graphml(self, path: str) -> None:
+        self.write_graphml_direct(path)
+
+    @staticmethod
+    def geometry_cache_clear() -> None:
+        """
+        Free the prism geometry memoized by :meth:`_calc_geometry`, which can
+        be tens of MB per size for large prisms.
+        """
+        Beam1Prism._calc_geometry.cache_clear()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2)
+    def _calc_geometry(xsize: int,
+                       ysize: int,
+                       zsize: int,
+                       is_EW: bool) -> tp.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute the vertex descriptors, anchors, and edges of a prism with the
+        specified size and orientation. Memoized so that targets of the same
+        size share a single computation, until :meth:`geometry_cache_clear` is
+        called; the returned arrays are read-only, as they are shared between
+        callers.
+        """
+        vds, anchors = Beam1Prism._calc_vertices(xsize, ysize, zsize, is_EW)
+        edges = Beam1Prism._calc_edges(vds, anchors, xsize, ysize, zsize)
+        for arr in (vds, anchors, edges):
+            arr.flags.writeable = False
+
+        return vds, anchors, edges
+
+    @staticmethod
+    def _calc_vertices(xsize: int,
+                       ysize: int,
+                       zsize: int,
+                       is_EW: bool) -> tp.Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the vertex descriptors and (X,Y,Z) anchors of all cube blocks in
+        the prism, in the order they are added to the graph.
+        """
+        # For rectprisms, there is no difference in the generated GRAPHML for +X
+        # vs -X, or +Y vs -Y. Cube blocks have no other end, so the semantic and
+        # edge paradigms give the same graph, and we can compute all anchors and
+        # their +X/+Y/+Z neighbors at once instead of adding blocks one by one.
+        if is_EW:
+            x, y, z = np.mgrid[0:xsize, 0:ysize, 0:zsize]
+        else:
+            y, x, z = np.mgrid[0:ysize, 0:xsize, 0:zsize]
+
+        anchors = np.stack((x.ravel(), y.ravel(), z.ravel()), axis=1)
+        vds = anchors[:, 2] * xsize * ysize + anchors[:, 1] * xsize + anchors[:, 0]
+        return vds, anchors
+
+    @staticmethod
+    def _calc_edges(vds: np.ndarray,
+                    anchors: np.ndarray,
+                    xsize: int,
+                    ysize: int,
+                    zsize: int) -> np.ndarray:
+        """
+        Compute the edges connecting each vertex to its +X/+Y/+Z manhattan
+        neighbors within the bounding box, as an (E,2) array of vertex
+        descriptors.
+        """
+        dims = np.array((xsize, ysize, zsize), dtype=int)
+
+        edges = []
+        for offset, stride in [((1, 0, 0), 1),
+                               ((0, 1, 0), xsize),
+                               ((0, 0, 1), xsize * ysize)]:
+            # Offsets are never negative, so only the upper bounds can be
+            # exceeded.
+            src = vds[np.all(anchors + offset < dims, axis=1)]
+            edges.append(np.stack((src, src + stride), axis=1))
+
+        return np.concatenate(edges)
+
 
 @implements.implements(IConcreteGMT)
 class Beam2Prism(BaseConstructTarget):
@@ -455,6 +785,8 @@ class Beam2Prism(BaseConstructTarget):
     Construction target class for 3D rectangular prismatic structures composed
     only of beam2 blocks.
     """
+    __slots__ = ()
+
     @staticmethod
     def uuid(target_id: int) -> str:
         return 'beam2_prism' + str(target_id)
@@ -468,23 +800,27 @@ class Beam2Prism(BaseConstructTarget):
 
     def gen_graph(self) -> nx.Graph:
         graph = nx.Graph()
-
-        if self.spec['orientation'].is_EW():
-            for x in range(0, self.extent.xsize(), 2):
-                for y in range(0, self.extent.ysize()):
-                    for z in range(0, self.extent.zsize()):
+        orientation = self.spec['orientation']
+        xsize = self.xsize
+        ysize = self.ysize
+        zsize = self.zsize
+
+        if orientation.is_EW():
+            for x in range(0, xsize, 2):
+                for y in range(0, ysize):
+                    for z in range(0, zsize):
                         self.graph_block_add(graph,
                                              'beam2',
                                              Vector3D(x, y, z),
-                                             self.spec['orientation'])
-        elif self.spec['orientation'].is_NS():
-            for y in range(0, self.extent.ysize(), 2):
-                for x in range(0, self.extent.xsize()):
-                    for z in range(0, self.extent.zsize()):
+                                             orientation)
+        elif orientation.is_NS():
+            for y in range(0, ysize, 2):
+                for x in range(0, xsize):
+                    for z in range(0, zsize):
                         self.graph_block_add(graph,
                                              'beam2',
                                              Vector3D(x, y, z),
-                                             self.spec['orientation'])
+                                             orientation)
         return graph
 
 
@@ -494,6 +830,8 @@ class Beam3Prism(BaseConstructTarget):
     Construction target class for 3D rectangular prismatic structures composed
     only of beam3 blocks.
     """
+    __slots__ = ()
+
     @staticmethod
     def uuid(target_id: int) -> str:
         return 'beam3_prism' + str(target_id)
@@ -507,23 +845,27 @@ class Beam3Prism(BaseConstructTarget):
 
     def gen_graph(self) -> nx.Graph:
         graph = nx.Graph()
-
-        if self.spec['orientation'].is_EW():
-            for x in range(0, self.extent.xsize(), 3):
-                for y in range(0, self.extent.ysize()):
-                    for z in range(0, self.extent.zsize()):
+        orientation = self.spec['orientation']
+        xsize = self.xsize
+        ysize = self.ysize
+        zsize = self.zsize
+
+        if orientation.is_EW():
+            for x in range(0, xsize, 3):
+                for y in range(0, ysize):
+                    for z in range(0, zsize):
                         self.graph_block_add(graph,
                                              'beam3',
                                              Vector3D(x, y, z),
-                                             self.spec['orientation'])
-        elif self.spec['orientation'].is_NS():
-            for y in range(0, self.extent.ysize(), 3):
-                for x in range(0, self.extent.xsize()):
-                    for z in range(0, self.extent.zsize()):
+                                             orientation)
+        elif orientation.is_NS():
+            for y in range(0, ysize, 3):
+                for x in range(0, xsize):
+                    for z in range(0, zsize):
                         self.graph_block_add(graph,
                                              'beam3',
                                              Vector3D(x, y, z),
-                                             self.spec['orientation'])
+                                             orientation)
         return graph
 
 
@@ -534,6 +876,8 @@ class MixedBeamPrism(BaseConstructTarget):
     of a mix of beam blocks.
 
     """
+    __slots__ = ()
+
     @staticmethod
     def uuid(target_id: int) -> str:
         return 'mixed_beam_prism' + str(target_id)
@@ -546,8 +890,10 @@ class MixedBeamPrism(BaseConstructTarget):
         super().__init__(spec, target_id, paradigm, graphml_path)
 
     def gen_graph(self) -> nx.Graph:
-        raise NotImplementedError("Error: Cannot generate mixed graph--manual \
-                                   specification required")
+        # There is no single way to tile a prism with a mix of beam blocks, so
+        # the graph for mixed structures must be specified manually.
+        raise NotImplementedError("Error: Cannot generate mixed graph--manual "
+                                  "specification required")
 
 
 @implements.implements(IConcreteGMT)
@@ -556,6 +902,8 @@ class Beam1Pyramid(BaseConstructTarget):
     Construction target class for 3D pyramids composed only of cube blocks;
     i.e., a stepped pyramid.
     """
+    __slots__ = ()
+
     @staticmethod
     def uuid(target_id: int) -> str:
         return 'beam1_pyramid' + str(target_id)
@@ -569,26 +917,27 @@ class Beam1Pyramid(BaseConstructTarget):
 
     def gen_graph(self) -> nx.Graph:
         graph = nx.Graph()
+        xsize = self.xsize
+        ysize = self.ysize
+        zsize = self.zsize
 
         # For rectprisms, there is no difference in the generated GRAPHML for +X
         # vs -X, or +Y vs -Y.
-        z = 0
         if self.spec['orientation'].is_EW():
-            for z in range(z, self.extent.zsize()):
-                for x in range(z, self.extent.xsize() - z):
-                    for y in range(z, self.extent.ysize() - z):
-                        self.graph_block_add(graph,
-                                             'beam1',
-                                             Vector3D(x, y, z),
-                                             self.spec['orientation'])
+            anchors = [(x, y, z)
+                       for z in range(0, zsize)
+                       for x in range(z, xsize - z)
+                       for y in range(z, ysize - z)]
         elif self.spec['orientation'].is_NS():
-            for z in range(0, self.extent.zsize()):
-                for y in range(z, self.extent.ysize() - z):
-                    for x in range(z, self.extent.xsize() - z):
-                        self.graph_block_add(graph,
-                                             'beam1',
-                                             Vector3D(x, y, z),
-                                             self.spec['orientation'])
+            anchors = [(x, y, z)
+                       for z in range(0, zsize)
+                       for y in range(z, ysize - z)
+                       for x in range(z, xsize - z)]
+
+        self._graph_cube_blocks_add(graph,
+                                    'beam1',
+                                    anchors,
+                                    self.spec['orientation'])
 
         return graph
 
@@ -604,6 +953,8 @@ class Ramp(BaseConstructTarget):
     The ratio between the length of beam1 blocks and ramp blocks.
     """
 
+    __slots__ = ('tag_adds', 'long_axis')
+
     @staticmethod
     def uuid(target_id: int) -> str:
         return 'ramp' + str(target_id)
@@ -615,81 +966,91 @@ class Ramp(BaseConstructTarget):
                  graphml_path: str) -> None:
         super().__init__(spec, target_id, paradigm, graphml_path)
         self.tag_adds = []
+
+        # The axis the ramp slopes along: 0 for X (EW), 1 for Y (NS).
+        self.long_axis = 0 if self.spec['orientation'].is_EW() else 1
         self._structure_sanity_checks()
 
     def _structure_sanity_checks(self):
-        if self.spec['orientation'].is_EW():
-            assert self.extent.xsize() % self.kRAMP_LENGTH_RATIO == 0,\
-                "X size={0} not a multiple for ramp block length ratio={1}".format(self.extent.xsize(),
-                                                                                   self.kRAMP_LENGTH_RATIO)
-        elif self.spec['orientation'].is_NS():
-            assert self.extent.ysize() % self.kRAMP_LENGTH_RATIO == 0,\
-                "Y size={0} not a multiple for ramp block length ratio {1}".format(self.extent.ysize(),
-                                                                                   self.kRAMP_LENGTH_RATIO)
+        size = self.spec['bb'][self.long_axis]
+        assert size % self.kRAMP_LENGTH_RATIO == 0,\
+            "{0} size={1} not a multiple for ramp block length ratio={2}".format('XY'[self.long_axis],
+                                                                                 size,
+                                                                                 self.kRAMP_LENGTH_RATIO)
+
+        # Each Z level moves the front of the ramp back by one ramp block, so
+        # the ramp must be long enough for all of them.
+        zsize = self.spec['bb'][2]
+        assert zsize * self.kRAMP_LENGTH_RATIO <= size,\
+            "Z size={0} too tall for {1} size={2} with ramp block length ratio={3}".format(zsize,
+                                                                                          'XY'[self.long_axis],
+                                                                                          size,
+                                                                                          self.kRAMP_LENGTH_RATIO)
 
     def gen_graph(self) -> nx.Graph:
-        graph = nx.Graph()
+        # Ramp blocks have no extent in the edge paradigm, so only the semantic
+        # representation is available.
+        if self.paradigm != 'semantic':
+            raise NotImplementedError("Error: Ramp graphs only supported for "
+                                      "semantic paradigm")
 
-        # First, generate beam1 blocks
-        self._gen_beam1_blocks(graph)
-
-        # Then, generate ramp blocks
-        self._gen_ramp_blocks(graph)
+        graph = nx.Graph()
+        self._gen_blocks(graph)
 
         return graph
 
-    def _gen_ramp_blocks(self, graph: nx.Graph) -> None:
+    def _gen_blocks(self, graph: nx.Graph) -> None:
         """
-        Add the nodes containing the anchor cells of ramp blocks to the
-        structure graph, along with the connections to their neighbors.
+        Add the nodes containing the anchor cells of the beam1 and ramp blocks
+        to the structure graph, along with the connections to their
+        neighbors. Both sets of anchors come from a single pass over the
+        bounding box; all beam1 blocks are added first, then all ramp blocks.
 
         """
-        ratio = self.kRAMP_LENGTH_RATIO
+        beam1_anchors, ramp_anchors = self.calc_anchors(self.extent,
+                                                        self.long_axis,
+                                                        self.kRAMP_LENGTH_RATIO)
+        self._graph_cube_blocks_add(graph,
+                                    'beam1',
+                                    beam1_anchors.tolist(),
+                                    self.spec['orientation'])
+
+        for x, y, z in ramp_anchors.tolist():
+            self.graph_block_add(graph,
+                                 'ramp2',
+                                 Vector3D(x, y, z),
+                                 self.spec['orientation'])
 
-        if self.spec['orientation'].is_EW():
-            corr = 1
-            for z in range(0, self.extent.zsize()):
-                x = self.extent.xsize() - ratio * corr
-                for y in range(0, self.extent.ysize()):
-                    self.graph_block_add(graph,
-                                         'ramp',
-                                         Vector3D(x, y, z))
-                corr += 1
-
-        elif self.spec['orientation'].is_NS():
-            for z in range(0, self.extent.zsize()):
-                y = self.extent.ysize() - ratio * corr
-                for x in range(0, self.extent.xsize()):
-                    self.graph_block_add(graph,
-                                         'ramp2',
-                                         Vector3D(x, y, z))
-                corr += 1
-
-    def _gen_beam1_blocks(self, graph: nx.Graph) -> None:
+    @staticmethod
+    def calc_anchors(extent: ArenaExtent,
+                     long_axis: int,
+                     ratio: int) -> tp.Tuple[np.ndarray, np.ndarray]:
         """
-        Add the nodes containing the anchor cells of beam1 blocks to the
-        structure graph, along with the connections to their neighbors.
-
+        Compute the anchor cells of the beam1 and ramp blocks making up a ramp
+        with the specified bounding box, sloping along the specified axis (0
+        for X, 1 for Y), in the order they should be added to the graph. The
+        front of the ramp moves back by ``ratio`` cells along the long axis for
+        each Z level.
+
+        Returns:
+            Tuple of (beam1 anchors, ramp anchors), each an (N,3) array of
+            (X,Y,Z) coordinates.
         """
-        ratio = self.kRAMP_LENGTH_RATIO
-
-        if self.spec['orientation'].is_EW():
-            corr = 1
-            for z in range(0, self.extent.zsize()):
-                for x in range(0, self.extent.xsize() - ratio * corr):
-                    for y in range(0, self.extent.ysize()):
-                        self.graph_block_add(graph,
-                                             'beam1',
-                                             Vector3D(x, y, z),
-                                             1)
-                corr += 1
-        elif self.spec['orientation'].is_NS():
-            corr = 1
-            for z in range(0, self.extent.zsize()):
-                for y in range(0, self.extent.ysize() - ratio * corr):
-                    for x in range(0, self.extent.xsize()):
-                        self.graph_block_add(graph,
-                                             'beam1',
-                                             Vector3D(x, y, z),
-                                             1)
-                corr += 1
+        xsize = extent.xsize()
+        ysize = extent.ysize()
+        zsize = extent.zsize()
+
+        if long_axis == 0:
+            z, x, y = np.mgrid[0:zsize, 0:xsize, 0:ysize]
+            beam1 = x < xsize - ratio * (z + 1)
+            rz, ry = np.mgrid[0:zsize, 0:ysize]
+            rx = xsize - ratio * (rz + 1)
+        else:
+            z, y, x = np.mgrid[0:zsize, 0:ysize, 0:xsize]
+            beam1 = y < ysize - ratio * (z + 1)
+            rz, rx = np.mgrid[0:zsize, 0:xsize]
+            ry = ysize - ratio * (rz + 1)
+
+        beam1_anchors = np.stack((x[beam1], y[beam1], z[beam1]), axis=1)
+        ramp_anchors = np.stack((rx.ravel(), ry.ravel(), rz.ravel()), axis=1)
+        return beam1_anchors, ramp_anchors
@@ -96,9 +96,13 @@ class ConstructionTargetSet():
         return [self.tag_adds]
 
     def gen_files(self) -> None:
-        for target in self.targets:
-            graph = target.gen_graph()
-            target.write_graphml(graph, target.graphml_path)
+        try:
+            for target in self.targets:
+                target.gen_graphml(target.graphml_path)
+        finally:
+            # Prism geometry is only shared between the targets in this set, so
+            # don't keep it alive once their files are written.
+            ct.Beam1Prism.geometry_cache_clear()
 
     def _gen_prism(self, target_id: int, spec: types.CLIArgSpec):
         if spec['composition'] == 'beam1':
@@ -0,0 +1,226 @@
+# Copyright 2021 John Harwell, All rights reserved.
+#
+#  This file is part of SIERRA.
+#
+#  SIERRA is free software: you can redistribute it and/or modify it under the
+#  terms of the GNU General Public License as published by the Free Software
+#  Foundation, either version 3 of the License, or (at your option) any later
+#  version.
+#
+#  SIERRA is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  SIERRA.  If not, see <http://www.gnu.org/licenses/
+
+"""
+Minimal GraphML writer for construction target graphs, which streams nodes and
+edges straight to a file instead of building an XML tree first as
+``networkx.write_graphml()`` does. Only the subset of GraphML that construction
+targets use is supported: undirected graphs with integer and string vertex and
+edge attributes.
+"""
+
+# Core packages
+import os
+import typing as tp
+from xml.sax.saxutils import escape
+
+# 3rd party packages
+
+# Project packages
+
+kKeyTypes = {int: 'long', str: 'string'}
+"""
+The GraphML ``attr.type`` for each supported attribute value type.
+"""
+
+kAttrEntities = {'"': '&quot;'}
+
+kFooter = '  </graph>\n</graphml>\n'
+
+kWriteBufSize = 1 << 20
+
+
+def gen_header(keys: tp.Sequence[tp.Tuple[str, str, str]]) -> str:
+    """
+    Generate the GraphML header, up to and including the opening ``<graph>``
+    tag.
+
+    Args:
+        keys: (domain, name, type) tuples for each attribute key, where domain
+              is ``node`` or ``edge``. Keys are assigned the IDs ``d0``,
+              ``d1``, ... in order.
+    """
+    header = ("<?xml version='1.0' encoding='utf-8'?>\n"
+              '<graphml xmlns="http://graphml.graphdrawing.org/xmlns" '
+              'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+              'xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns '
+              'http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
+    for i, (domain, name, attr_type) in enumerate(keys):
+        header += '  <key id="d{0}" for="{1}" attr.name="{2}" attr.type="{3}" />\n'.format(i,
+                                                                                             domain,
+                                                                                             escape(name, kAttrEntities),
+                                                                                             attr_type)
+
+    return header + '  <graph edgedefault="undirected">\n'
+
+
+class GraphMLWriter():
+    """
+    Context manager for streaming a graph to a GraphML file one node or edge at
+    a time, so that the graph never needs to be in memory all at once. Nodes
+    are written as they are added; GraphML conventionally lists all nodes
+    before any edges, so edges are buffered and written when the writer is
+    closed.
+
+    The graph is written to a temporary file next to :attr:`path`, which
+    replaces :attr:`path` only once the graph is complete, so an error part way
+    through never leaves a truncated file behind.
+
+    Attributes:
+        path: The file to write to.
+        tmp_path: The temporary file written to until the graph is complete.
+        keys: (domain, name, type) tuples for each attribute key, as passed to
+              :func:`gen_header`.
+        data: Template for the ``<data>`` element of each attribute, keyed by
+              (domain, name).
+        edges: The edges added so far, as (source, target, attributes) tuples.
+        outfile: The open file. Callers which can format elements faster
+                 themselves may write them to it directly, nodes before
+                 edges.
+    """
+
+    __slots__ = ('path', 'tmp_path', 'keys', 'data', 'edges', 'outfile')
+
+    def __init__(self,
+                 path: str,
+                 keys: tp.Sequence[tp.Tuple[str, str, str]]) -> None:
+        self.path = path
+        self.tmp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+        self.keys = keys
+        self.data = {(domain, name): '      <data key="d' + str(i) + '">%s</data>\n'
+                     for i, (domain, name, _) in enumerate(keys)}
+        self.edges = []  # type: tp.List[tp.Tuple[tp.Any, tp.Any, tp.Dict[str, tp.Any]]]
+        self.outfile = None  # type: tp.Optional[tp.TextIO]
+
+    def __enter__(self) -> 'GraphMLWriter':
+        self.outfile = open(self.tmp_path, 'w', buffering=kWriteBufSize)
+        try:
+            self.outfile.write(gen_header(self.keys))
+        except BaseException:
+            self._discard()
+            raise
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self._discard()
+            return
+
+        try:
+            self._write_edges()
+            self.outfile.write(kFooter)
+            self.outfile.close()
+        except BaseException:
+            self._discard()
+            raise
+
+        self.outfile = None
+        os.replace(self.tmp_path, self.path)
+
+    def _discard(self) -> None:
+        self.outfile.close()
+        self.outfile = None
+        os.remove(self.tmp_path)
+
+    def node(self, vd: tp.Any, attrs: tp.Dict[str, tp.Any]) -> None:
+        """
+        Write a node with the specified attributes, which must all have been
+        declared as ``node`` keys.
+        """
+        if not attrs:
+            self.outfile.write('    <node id="%s" />\n' % escape(str(vd), kAttrEntities))
+            return
+
+        data = self.data
+        self.outfile.write('    <node id="%s">\n' % escape(str(vd), kAttrEntities) +
+                           ''.join(data[('node', name)] % escape(str(val))
+                                   for name, val in attrs.items()) +
+                           '    </node>\n')
+
+    def edge(self, u: tp.Any, v: tp.Any, attrs: tp.Dict[str, tp.Any]) -> None:
+        """
+        Add an edge with the specified attributes, which must all have been
+        declared as ``edge`` keys.
+        """
+        self.edges.append((u, v, attrs))
+
+    def _write_edges(self) -> None:
+        data = self.data
+        write = self.outfile.write
+        for u, v, attrs in self.edges:
+            elt = '    <edge source="%s" target="%s"' % (escape(str(u), kAttrEntities),
+                                                         escape(str(v), kAttrEntities))
+            if not attrs:
+                write(elt + ' />\n')
+                continue
+
+            write(elt + '>\n' +
+                  ''.join(data[('edge', name)] % escape(str(val))
+                          for name, val in attrs.items()) +
+                  '    </edge>\n')
+
+        self.edges = []
+
+
+def write_graphml_fast(nodes: tp.Iterable[tp.Tuple[int, tp.Dict[str, tp.Any]]],
+                       edges: tp.Iterable[tp.Tuple[int, int, tp.Dict[str, tp.Any]]],
+                       path: str) -> None:
+    """
+    Write the GraphML for a graph to the filesystem. The result is equivalent to
+    ``networkx.write_graphml()`` for the same nodes and edges.
+
+    Args:
+        nodes: (vertex, attributes) tuples, as from ``graph.nodes(data=True)``.
+
+        edges: (source, target, attributes) tuples, as from
+               ``graph.edges(data=True)``.
+
+        path: The file to write to.
+
+    Raises:
+        ValueError: If an attribute value is not of a supported type, or if
+                    the same attribute has values of different types. Nothing
+                    is written to the filesystem in this case.
+    """
+    nodes = list(nodes)
+    edges = list(edges)
+
+    # Attribute keys must all be declared before the graph, so collect them
+    # first. Keys are numbered in the order they are first seen, nodes before
+    # edges, same as networkx.
+    keys = {}  # type: tp.Dict[tp.Tuple[str, str], str]
+    for domain, elts in [('node', (attrs for _, attrs in nodes)),
+                         ('edge', (attrs for _, _, attrs in edges))]:
+        for attrs in elts:
+            for name, val in attrs.items():
+                attr_type = kKeyTypes.get(type(val))
+                if attr_type is None:
+                    raise ValueError("Unsupported type {0} for GraphML {1} attribute '{2}'".format(type(val),
+                                                                                                   domain,
+                                                                                                   name))
+                if keys.setdefault((domain, name), attr_type) != attr_type:
+                    raise ValueError("Mixed types for GraphML {0} attribute '{1}'".format(domain,
+                                                                                          name))
+
+    with GraphMLWriter(path,
+                       [(domain, name, attr_type)
+                        for (domain, name), attr_type in keys.items()]) as writer:
+        for vd, attrs in nodes:
+            writer.node(vd, attrs)
+
+        for u, v, attrs in edges:
+            writer.edge(u, v, attrs)
@@ -30,6 +30,15 @@ class Orientation():
     """
     Represents the orientation of a construction target as one of the 4 cardinal
     directions.
+
+    Attributes:
+        str_val: The orientation as a string (``0``, ``PI/2``, ``PI``, or
+                 ``3PI/2``).
+        num_val: The orientation in radians.
+        north: Is the orientation north (``PI/2``)?
+        south: Is the orientation south (``3PI/2``)?
+        east: Is the orientation east (``0``)?
+        west: Is the orientation west (``PI``)?
     """
 
     @staticmethod
@@ -49,26 +58,33 @@ class Orientation():
         self.str_val = val
         self.num_val = self.to_radians(val)
 
+        # Orientations are queried for every block added to a structure, so
+        # compute the answers once up front.
+        self.north = val == 'PI/2'
+        self.south = val == '3PI/2'
+        self.east = val == '0'
+        self.west = val == 'PI'
+
     def __str__(self):
         return str(self.num_val)
 
     def is_NS(self) -> bool:
-        return self.is_N() or self.is_S()
+        return self.north or self.south
 
     def is_EW(self) -> bool:
-        return self.is_E() or self.is_W()
+        return self.east or self.west
 
     def is_N(self) -> bool:
-        return self.str_val in ['PI/2']
+        return self.north
 
     def is_S(self) -> bool:
-        return self.str_val in ['3PI/2']
+        return self.south
 
     def is_E(self) -> bool:
-        return self.str_val in ['0']
+        return self.east
 
     def is_W(self) -> bool:
-        return self.str_val in ['PI']
+        return self.west
 
     @staticmethod
     def to_radians(orientation: str) -> float:
@@ -73,8 +73,7 @@ class GMTGenerator():
                 self.logger.info("Processing target '%s' -> '%s'",
                                  args.ct_specs[i],
                                  opath)
-                graph = target_set.targets[i].gen_graph()
-                target_set.targets[i].write_graphml(graph, opath)
+                target_set.targets[i].gen_graphml(opath)
 
 
 class PaperFigureGenerator():
@@ -104,30 +103,24 @@ class PaperFigureGenerator():
                                ["0"],
                                args.ct_paradigm,
                                "").targets[0]
-        graph = target.gen_graph()
-        target.write_graphml(graph,
-                             os.path.join(args.output_dir,
-                                          "beam1.graphml"))
+        target.gen_graphml(os.path.join(args.output_dir,
+                                        "beam1.graphml"))
 
         # Beam2 block
         target = ctset.factory(["ct_specs.prism.beam2.2x1x1@0,0,0"],
                                ["0"],
                                args.ct_paradigm,
                                "").targets[0]
-        graph = target.gen_graph()
-        target.write_graphml(graph,
-                             os.path.join(args.output_dir,
-                                          "beam2.graphml"))
+        target.gen_graphml(os.path.join(args.output_dir,
+                                        "beam2.graphml"))
 
         # Beam3 block
         target = ctset.factory(["ct_specs.prism.beam3.3x1x1@0,0,0"],
                                ["0"],
                                args.ct_paradigm,
                                "").targets[0]
-        graph = target.gen_graph()
-        target.write_graphml(graph,
-                             os.path.join(args.output_dir,
-                                          "beam3.graphml"))
+        target.gen_graphml(os.path.join(args.output_dir,
+                                        "beam3.graphml"))
 
     def _coherent_cube(self, args: argparse.Namespace) -> None:
         self.logger.info("Processing coherent cube")
@@ -135,10 +128,8 @@ class PaperFigureGenerator():
                                ["0"],
                                args.ct_paradigm,
                                "").targets[0]
-        graph = target.gen_graph()
-        target.write_graphml(graph,
-                             os.path.join(args.output_dir,
-                                          "coherent-cube.graphml"))
+        target.gen_graphml(os.path.join(args.output_dir,
+                                        "coherent-cube.graphml"))
 
     def _coherent_pyramid(self, args: argparse.Namespace) -> None:
         self.logger.info("Processing coherent pyramid")
@@ -147,10 +138,8 @@ class PaperFigureGenerator():
                                ["0"],
                                args.ct_paradigm,
                                "").targets[0]
-        graph = target.gen_graph()
-        target.write_graphml(graph,
-                             os.path.join(args.output_dir,
-                                          "coherent-pyramid.graphml"))
+        target.gen_graphml(os.path.join(args.output_dir,
+                                        "coherent-pyramid.graphml"))
 
     def _coherent_cube_horizontal_hole(self, args: argparse.Namespace) -> None:
         self.logger.info("Processing coherent cube (horizontal hole)")